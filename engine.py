@@ -237,8 +237,19 @@ class RumbaEngine(Engine):
         Engine Constructor
         """
         self._dock_widgets = []
+        self._tk_rumba = None
+        self._save_as_callback = None
         Engine.__init__(self, *args, **kwargs)
 
+    @property
+    def tk_rumba(self):
+        """
+        The engine's python module, imported the first time it is needed.
+        """
+        if self._tk_rumba is None:
+            self._tk_rumba = self.import_module("tk_rumba")
+        return self._tk_rumba
+
     @property
     def context_change_allowed(self):
         """
@@ -423,10 +434,11 @@ class RumbaEngine(Engine):
         # already exist
         if self.has_ui:
             # create our menu handler
-            tk_rumba = self.import_module("tk_rumba")
-            if tk_rumba.can_create_menu():
+            if self.tk_rumba.can_create_menu():
                 self.logger.debug("Creating shotgun menu...")
-                self._menu_generator = tk_rumba.MenuGenerator(self, self._menu_name)
+                self._menu_generator = self.tk_rumba.MenuGenerator(
+                    self, self._menu_name
+                )
                 self._menu_generator.create_menu(disabled=disabled)
                 # monitor for document changes
                 self.logger.debug("%s: Starting active doc timer...", self)
@@ -469,11 +481,33 @@ class RumbaEngine(Engine):
         :param new_context: The new context being changed to.
         """
 
+        # the apps are reloaded for the new context, the save callback has to
+        # be looked up again
+        self._save_as_callback = None
+
         if self.get_setting("automatic_context_switch", True):
             # finally create the menu with the new context if needed
             if old_context != new_context:
                 self.create_shotgun_menu()
 
+    def get_save_as_action(self):
+        """
+        Returns a log action dict for saving the current session, used by the
+        hooks when the session needs saving before they can continue.
+
+        :returns: A dictionary suitable as the extra argument of a log call.
+        """
+        if self._save_as_callback is None:
+            self._save_as_callback = self.tk_rumba.get_save_as_callback(self)
+
+        return {
+            "action_button": {
+                "label": "Save As...",
+                "tooltip": "Save the current session",
+                "callback": self._save_as_callback,
+            }
+        }
+
     def _run_app_instance_commands(self):
         """
         Runs the series of app instance commands listed in the
@@ -14,6 +14,7 @@
 
 from tank import Hook
 import os
+import sys
 
 
 __author__ = "Diego Garcia Huerta"
@@ -25,70 +26,45 @@ import rumba
 import sgtk.util
 
 
-def find_nodes_with_reference(node, results=None):
+def _collect_refs(root):
     """
-    Recursively find nodes that have been referenced within the hierarchy of
-    a given a root node.
+    Yield (node, type_name, path) tuples for every node referencing a file
+    within the hierarchy of a given root node. Each node is inspected only
+    once for all the supported types: Asset, UsdAsset, and Media nodes
     """
-    if results is None:
-        results = []
-
-    if node.reference_filename():
-        results.append(node)
-
-    for child_node in node.children():
-        find_nodes_with_reference(child_node, results=results)
-
-    return results
-
-
-def find_nodes_with_plug(node, plug_name, type_names=None, results=None):
-    """
-    Recursively finds nodes with plugs with a specified name within the
-    hierarchy of a given a root node. Optionally we can specify a list of node
-    types to filter by.
-    """
-
-    if results is None:
-        results = []
-
-    if node.has_plug(plug_name):
-        # if types were specified filter by them
-        if (type_names and node.type_name() in type_names) or type_names is None:
-            results.append(node)
-
-    for child_node in node.children():
-        find_nodes_with_plug(
-            child_node, plug_name, type_names=type_names, results=results
-        )
-
-    return results
-
-
-def get_node_file_path(node):
-    """
-    Retrieve the file path referenced by nodes of different types.
-    Suppoted types are: Asset, UsdAsset, and Media nodes
-    """
-    if node.type_name() in ["Asset"]:
-        return node.reference_filename()
-    elif node.type_name() in ["UsdAsset"]:
-        return node.plug("file_path").as_string()
-    elif node.type_name() in ["Media"]:
-        return node.plug("file").as_string()
-
+    # walk the hierarchy with an explicit stack rather than recursion, deep
+    # documents would otherwise pay a python frame per node. Children are
+    # pushed reversed so nodes are still visited in depth-first order.
+    stack = [root]
+    stack_pop = stack.pop
+    stack_extend = stack.extend
+    while stack:
+        node = stack_pop()
+
+        # the type is queried once per node and handed down to whoever needs
+        # it, every call is a round trip into Rumba. The type alone tells
+        # which plug holds the path, so there is no need to probe for plugs.
+        type_name = node.type_name()
+        getter = _GETTERS.get(type_name)
+        if getter:
+            path = getter(node)
+            if path:
+                yield node, type_name, path
+        stack_extend(reversed(node.children()))
+
+
+# how to read/write the file path referenced by each of the supported types
+_GETTERS = {
+    "Asset": lambda node: node.reference_filename(),
+    "UsdAsset": lambda node: node.plug("file_path").as_string(),
+    "Media": lambda node: node.plug("file").as_string(),
+}
 
-def set_node_file_path(node, path):
-    """
-    Set the file path referenced by nodes of different types.
-    Suppoted types are: Asset, UsdAsset, and Media nodes
-    """
-    if node.type_name() in ["Asset"]:
-        return node.replace_reference(path)
-    elif node.type_name() in ["UsdAsset"]:
-        return node.plug("file_path").set_value(path)
-    elif node.type_name() in ["Media"]:
-        return node.plug("file").set_value(path)
+_SETTERS = {
+    "Asset": lambda node, path: node.replace_reference(path),
+    "UsdAsset": lambda node, path: node.plug("file_path").set_value(path),
+    "Media": lambda node, path: node.plug("file").set_value(path),
+}
 
 
 # let's put some color to these gray-ish UIs
@@ -98,6 +74,17 @@ ITEM_COLORS = {
     "Media": "#1da8e7",
     "default": "#a81de7",
 }
+_DEFAULT_COLOR = ITEM_COLORS["default"]
+
+# the label markup for each known node type is built once, so only the node
+# name needs to be inserted for every item
+_LABEL_TEMPLATES = {
+    node_type: (
+        f"<span style='color:{node_color}'><b>",
+        f"</b></span><br/><nobr><b><sub>{node_type}</sub></b></nobr>",
+    )
+    for node_type, node_color in ITEM_COLORS.items()
+}
 
 
 class BreakdownSceneItem(str):
@@ -111,19 +98,26 @@ class BreakdownSceneItem(str):
     python friendly object + __repr__ magic method.
     """
 
-    def __new__(cls, node, file_path):
+    def __new__(cls, node, file_path, node_type=None):
         node_name = node.full_document_name()
-        node_type = node.type_name()
-        node_color = ITEM_COLORS.get(node_type, ITEM_COLORS["default"])
-        text = (
-            "<span style='color:%s'><b>%s</b></span>"
-            "<br/><nobr><b><sub>%s</sub></b></nobr>"
-            % (node_color, node_name, node_type)
-        )
+        if node_type is None:
+            node_type = node.type_name()
+        label_template = _LABEL_TEMPLATES.get(node_type)
+        if label_template:
+            prefix, suffix = label_template
+            text = prefix + node_name + suffix
+        else:
+            text = (
+                f"<span style='color:{_DEFAULT_COLOR}'><b>{node_name}</b></span>"
+                f"<br/><nobr><b><sub>{node_type}</sub></b></nobr>"
+            )
 
         item = str.__new__(cls, text)
         item.node = node_name
-        item.node_type = node_type
+        # there is only a handful of node types, so let all the items share
+        # the same string, which is also what the type dispatch tables use as
+        # keys. Node names are unique, so they would gain nothing from it.
+        item.node_type = sys.intern(node_type)
 
         return item
 
@@ -163,26 +157,13 @@ class BreakdownSceneOperations(Hook):
 
         active_document = rumba.active_document()
         if active_document:
-            nodes = find_nodes_with_reference(active_document) or []
-            nodes += find_nodes_with_plug(
-                active_document, "file_path", type_names=["UsdAsset"]
-            )
-            nodes += find_nodes_with_plug(active_document, "file", type_names=["Media"])
-
-            for node in nodes:
-                ref_path = get_node_file_path(node)
-                if ref_path:
-                    refs.append(
-                        {
-                            "node": BreakdownSceneItem(node, ref_path),
-                            "type": "file",
-                            "path": ref_path,
-                        }
-                    )
-
-        app = self.parent
-        engine = app.engine
-        engine.log_debug("refs: %s" % refs)
+            # tk-multi-breakdown expects a list, but it is filled straight from
+            # the scene traversal so no intermediate node lists are kept
+            refs = list(self._iter_refs(active_document))
+
+        # the hook logger formats its arguments only if debug logging is on,
+        # which matters as the list of references can be very long
+        self.logger.debug("refs: %s", refs)
 
         return refs
 
@@ -198,17 +179,40 @@ class BreakdownSceneOperations(Hook):
         the that each attribute should be updated *to* rather than the current
         path.
         """
-        app = self.parent
-        engine = app.engine
-        engine.log_debug("items: %s" % items)
+        self.logger.debug("items: %s", items)
 
         active_document = rumba.active_document()
         if active_document:
-            rumba.modify_begin("Shotgun Update References")
+            log_debug = self.logger.debug
+
+            # resolve all the nodes to update before opening the modify block,
+            # so only the actual writes happen while Rumba is modifying the
+            # document
+            plan = []
             for i in items:
                 new_path = i["path"]
                 node_name = i["node"].node
                 node = active_document.child(node_name)
-                engine.log_debug("Updating node: %s to path %s" % (node_name, new_path))
-                set_node_file_path(node, new_path)
-            rumba.modify_end()
+                if node:
+                    setter = _SETTERS[i["node"].node_type]
+                    plan.append((setter, node, node_name, new_path))
+
+            rumba.modify_begin("Shotgun Update References")
+            try:
+                for setter, node, node_name, new_path in plan:
+                    log_debug("Updating node: %s to path %s", node_name, new_path)
+                    setter(node, new_path)
+            finally:
+                rumba.modify_end()
+
+    def _iter_refs(self, root):
+        """
+        Lazily generate the scan_scene dictionaries for all the nodes
+        referencing a file within the hierarchy of the given root node.
+        """
+        for node, node_type, ref_path in _collect_refs(root):
+            yield {
+                "node": BreakdownSceneItem(node, ref_path, node_type),
+                "type": "file",
+                "path": ref_path,
+            }
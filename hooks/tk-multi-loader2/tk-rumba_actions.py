@@ -17,6 +17,8 @@ Hook that loads defines all the available actions, broken down by publish type.
 """
 
 import os
+from concurrent.futures import ThreadPoolExecutor
+
 import sgtk
 
 import rumba
@@ -30,15 +32,61 @@ __contact__ = "https://www.linkedin.com/in/diegogh/"
 HookBaseClass = sgtk.get_hook_baseclass()
 
 
-RUMBA_SUPPORTED_FORMATS = (".rumbanode", ".abc", ".usd", ".usda", ".usdc")
-RUMBA_SUPPORTED_MEDIA_FORMATS = (
-    rumba_media.audio_formats()[1]
-    + rumba_media.image_formats()[1]
-    + rumba_media.video_formats()[1]
+# sets of lowercase extensions, so the candidate extensions can be matched
+# with a single lookup
+RUMBA_SUPPORTED_FORMATS = frozenset((".rumbanode", ".abc", ".usd", ".usda", ".usdc"))
+RUMBA_SUPPORTED_MEDIA_FORMATS = frozenset(
+    ext.lower()
+    for ext in (
+        rumba_media.audio_formats()[1]
+        + rumba_media.image_formats()[1]
+        + rumba_media.video_formats()[1]
+    )
 )
 
+# number of threads used to resolve publish paths when loading a batch, kept
+# small so the Shotgun API is not flooded with concurrent requests
+MAX_RESOLVE_WORKERS = 8
+
+# the actions this hook knows how to execute, in the order they are presented
+_ACTION_TEMPLATES = {
+    "reference": {
+        "name": "reference",
+        "params": None,
+        "caption": "Reference into the current Document",
+        "description": "This file will be referenced into the current Document",
+    },
+    "import": {
+        "name": "import",
+        "params": None,
+        "caption": "Import into the current Document",
+        "description": "This file will be imported into the current Document",
+    },
+    "import_media": {
+        "name": "import_media",
+        "params": None,
+        "caption": "Import media into the current Session",
+        "description": (
+            "This file will be imported as a media into the current session"
+        ),
+    },
+}
+
 
 class RumbaActions(HookBaseClass):
+    def __init__(self, *args, **kwargs):
+        super(RumbaActions, self).__init__(*args, **kwargs)
+
+        # action name -> (extension check, handler)
+        self._action_dispatch = {
+            "reference": (self._is_a_supported_extension, self._reference_impl),
+            "import": (self._is_a_supported_extension, self._import_impl),
+            "import_media": (
+                self._is_a_supported_media_extension,
+                self._import_media_impl,
+            ),
+        }
+
     # public interface - to be overridden by deriving classes
 
     def generate_actions(self, sg_publish_data, actions, ui_area):
@@ -89,49 +137,21 @@ class RumbaActions(HookBaseClass):
         :returns List of dictionaries, each with keys name, params, caption and
          description
         """
-        app = self.parent
-        app.log_debug(
+        self.logger.debug(
             "Generate actions called for UI element %s. "
-            "Actions: %s. Publish Data: %s" % (ui_area, actions, sg_publish_data)
+            "Actions: %s. Publish Data: %s",
+            ui_area,
+            actions,
+            sg_publish_data,
         )
 
-        action_instances = []
-
-        if "reference" in actions:
-            action_instances.append(
-                {
-                    "name": "reference",
-                    "params": None,
-                    "caption": "Reference into the current Document",
-                    "description": (
-                        "This file will be referenced into the current Document"
-                    ),
-                }
-            )
-
-        if "import" in actions:
-            action_instances.append(
-                {
-                    "name": "import",
-                    "params": None,
-                    "caption": "Import into the current Document",
-                    "description": (
-                        "This file will be imported into the current Document"
-                    ),
-                }
-            )
-
-        if "import_media" in actions:
-            action_instances.append(
-                {
-                    "name": "import_media",
-                    "params": None,
-                    "caption": "Import media into the current Session",
-                    "description": (
-                        "This file will be imported as a media into the current session"
-                    ),
-                }
-            )
+        # the loader owns the returned dictionaries, so hand out copies of
+        # the templates rather than the templates themselves
+        action_instances = [
+            dict(template)
+            for name, template in _ACTION_TEMPLATES.items()
+            if name in actions
+        ]
 
         return action_instances
 
@@ -139,8 +159,8 @@ class RumbaActions(HookBaseClass):
         """
         Executes the specified action on a list of items.
 
-        The default implementation dispatches each item from ``actions`` to
-        the ``execute_action`` method.
+        The default implementation applies all the items from ``actions`` as
+        a single batch.
 
         The ``actions`` is a list of dictionaries holding all the actions to
         execute.
@@ -151,24 +171,27 @@ class RumbaActions(HookBaseClass):
             params: Parameters passed down from the generate_actions hook.
 
         .. note::
-            This is the default entry point for the hook. It reuses the
-            ``execute_action`` method for backward compatibility with hooks
-            written for the previous version of the loader.
+            This is the default entry point for the hook. All the actions are
+            resolved and validated first and then applied to the document
+            within a single modify block, so loading a selection produces a
+            single undo entry.
 
         .. note::
-            The hook will stop applying the actions on the selection if an
-            error is raised midway through.
+            The hook will not apply any of the actions on the selection if one
+            of them refers to an unsupported file.
 
         :param list actions: Action dictionaries.
         """
-        app = self.parent
+        batch = []
         for single_action in actions:
-            app.log_debug("Single Action: %s" % single_action)
+            self.logger.debug("Single Action: %s", single_action)
             name = single_action["name"]
             sg_publish_data = single_action["sg_publish_data"]
             params = single_action["params"]
 
-            self.execute_action(name, params, sg_publish_data)
+            batch.append((name, params, sg_publish_data))
+
+        self._execute_batch(batch)
 
     def execute_action(self, name, params, sg_publish_data):
         """
@@ -182,31 +205,82 @@ class RumbaActions(HookBaseClass):
                                 publish fields.
         :returns: No return value expected.
         """
-        app = self.parent
-        app.log_debug(
+        self.logger.debug(
             "Execute action called for action `%s`. "
-            "Parameters: %s. Publish Data: %s" % (name, params, sg_publish_data)
+            "Parameters: %s. Publish Data: %s",
+            name,
+            params,
+            sg_publish_data,
         )
 
+        self._execute_batch([(name, params, sg_publish_data)])
+
+    def _execute_batch(self, actions):
+        """
+        Resolve, validate and apply a list of actions to the current document
+        within a single modify block.
+
+        :param actions: List of (name, params, sg_publish_data) tuples.
+        """
+        actions = [action for action in actions if action[0] in self._action_dispatch]
+
+        # resolving the publish paths and checking them on disk is I/O bound
+        # and independent for each action, so do it concurrently. The Rumba
+        # API itself is only ever used from this thread.
+        sg_publishes = [sg_publish_data for _, _, sg_publish_data in actions]
+        if len(sg_publishes) > 1:
+            with ThreadPoolExecutor(max_workers=MAX_RESOLVE_WORKERS) as executor:
+                resolved = list(executor.map(self._resolve, sg_publishes))
+        else:
+            resolved = [
+                self._resolve(sg_publish_data) for sg_publish_data in sg_publishes
+            ]
+
+        # validate every action before touching the document, so the modify
+        # block only contains the actual Rumba changes
+        pending = []
+        for (name, params, sg_publish_data), (path, exists) in zip(actions, resolved):
+            is_supported, handler = self._action_dispatch[name]
+            if not is_supported(path, sg_publish_data):
+                raise Exception("Unsupported file extension for '%s'!" % path)
+
+            if not exists:
+                self.logger.warning("Path to load not found!: %s", path)
+                continue
+
+            pending.append((handler, path, sg_publish_data))
+
+        if not pending:
+            return
+
+        active_document = rumba.active_document()
+        if not active_document:
+            return
+
+        rumba.modify_begin("Shotgun Load Files")
+        try:
+            for handler, path, sg_publish_data in pending:
+                handler(active_document, path, sg_publish_data)
+        finally:
+            rumba.modify_end()
+
+    def _resolve(self, sg_publish_data):
+        """
+        Resolve the path of a publish, together with whether it exists on
+        disk, so each is only computed once.
+
+        :param sg_publish_data: Shotgun data dictionary with all the standard
+                                publish fields.
+        :returns: Tuple of (path, exists)
+        """
         # resolve path
         # toolkit uses utf-8 encoded strings internally and Rumba API expects
         # unicode so convert the path to ensure filenames containing complex
         # characters are supported
         path = self.get_publish_path(sg_publish_data).replace(os.path.sep, "/")
-        app.log_debug("Publish path: %s" % path)
+        self.logger.debug("Publish path: %s", path)
 
-        if name == "reference":
-            if not self._is_a_supported_extension(path, sg_publish_data):
-                raise Exception("Unsupported file extension for '%s'!" % path)
-            self._reference_into_current_document(path, sg_publish_data)
-        elif name == "import":
-            if not self._is_a_supported_extension(path, sg_publish_data):
-                raise Exception("Unsupported file extension for '%s'!" % path)
-            self._import_into_current_document(path, sg_publish_data)
-        elif name == "import_media":
-            if not self._is_a_supported_media_extension(path, sg_publish_data):
-                raise Exception("Unsupported file extension for '%s'!" % path)
-            self._import_media_into_new_media_layer(path, sg_publish_data)
+        return path, os.path.exists(path)
 
     def _is_a_supported_extension(self, path, sg_publish_data):
         _, ext = os.path.splitext(path)
@@ -224,17 +298,13 @@ class RumbaActions(HookBaseClass):
         :param sg_publish_data: Shotgun data dictionary with all the standard
                                 publish fields.
         """
-        app = self.parent
-        active_document = rumba.active_document()
-
-        if active_document:
-            if os.path.exists(path):
-                app.log_debug("Referencing path: %s" % path)
-                rumba.modify_begin("Shotgun Reference File")
-                rumba.reference(active_document, path, "")
-                rumba.modify_end()
-            else:
-                app.log_warning("Referencing path not found!: %s" % path)
+        self._apply_to_current_document(
+            "Shotgun Reference File",
+            self._reference_impl,
+            path,
+            sg_publish_data,
+            "Referencing path not found!: %s",
+        )
 
     def _import_into_current_document(self, path, sg_publish_data):
         """
@@ -244,17 +314,13 @@ class RumbaActions(HookBaseClass):
         :param sg_publish_data: Shotgun data dictionary with all the standard
                                 publish fields.
         """
-        app = self.parent
-        active_document = rumba.active_document()
-
-        if active_document:
-            if os.path.exists(path):
-                app.log_debug("Importing path: %s" % path)
-                rumba.modify_begin("Shotgun Import File")
-                rumba.load_node(active_document, path, "")
-                rumba.modify_end()
-            else:
-                app.log_warning("Path to import not found!: %s" % path)
+        self._apply_to_current_document(
+            "Shotgun Import File",
+            self._import_impl,
+            path,
+            sg_publish_data,
+            "Path to import not found!: %s",
+        )
 
     def _import_media_into_new_media_layer(self, path, sg_publish_data):
         """
@@ -264,17 +330,81 @@ class RumbaActions(HookBaseClass):
         :param sg_publish_data: Shotgun data dictionary with all the standard
                                 publish fields.
         """
-        app = self.parent
+        self._apply_to_current_document(
+            "Shotgun Import File",
+            self._import_media_impl,
+            path,
+            sg_publish_data,
+            "Path to import not found!: %s",
+        )
+
+    def _apply_to_current_document(
+        self, modify_name, handler, path, sg_publish_data, missing_message
+    ):
+        """
+        Applies a single action handler to the current document within its own
+        modify block.
+
+        :param modify_name: Name of the modify block, as shown in the undo
+                            history.
+        :param handler: One of the _impl methods.
+        :param path: Path to file.
+        :param sg_publish_data: Shotgun data dictionary with all the standard
+                                publish fields.
+        :param missing_message: Warning logged when the path does not exist.
+        """
         active_document = rumba.active_document()
+        if not active_document:
+            return
+
+        if not os.path.exists(path):
+            self.logger.warning(missing_message, path)
+            return
+
+        rumba.modify_begin(modify_name)
+        try:
+            handler(active_document, path, sg_publish_data)
+        finally:
+            rumba.modify_end()
+
+    def _reference_impl(self, active_document, path, sg_publish_data):
+        """
+        References a file into the current document. Expected to be called
+        within a modify block.
+
+        :param active_document: The current Rumba document.
+        :param path: Path to file.
+        :param sg_publish_data: Shotgun data dictionary with all the standard
+                                publish fields.
+        """
+        self.logger.debug("Referencing path: %s", path)
+        rumba.reference(active_document, path, "")
+
+    def _import_impl(self, active_document, path, sg_publish_data):
+        """
+        Imports a file into the current document. Expected to be called
+        within a modify block.
 
-        if active_document:
-            if os.path.exists(path):
-                rumba.modify_begin("Shotgun Import File")
-                layer_name = sg_publish_data.get("code", os.path.basename(path))
-                media_layer = rumbapy.add_media_layer(layer_name)
-                frame = rumba.current_frame()
-                media_node = rumbapy.get_media(path)
-                rumbapy.add_media_clip(media_layer, media_node, frame)
-                rumba.modify_end()
-            else:
-                app.log_warning("Path to import not found!: %s" % path)
+        :param active_document: The current Rumba document.
+        :param path: Path to file.
+        :param sg_publish_data: Shotgun data dictionary with all the standard
+                                publish fields.
+        """
+        self.logger.debug("Importing path: %s", path)
+        rumba.load_node(active_document, path, "")
+
+    def _import_media_impl(self, active_document, path, sg_publish_data):
+        """
+        Imports a media file into a new media layer. Expected to be called
+        within a modify block.
+
+        :param active_document: The current Rumba document.
+        :param path: Path to file.
+        :param sg_publish_data: Shotgun data dictionary with all the standard
+                                publish fields.
+        """
+        layer_name = sg_publish_data.get("code", os.path.basename(path))
+        media_layer = rumbapy.add_media_layer(layer_name)
+        frame = rumba.current_frame()
+        media_node = rumbapy.get_media(path)
+        rumbapy.add_media_clip(media_layer, media_node, frame)
@@ -13,6 +13,8 @@
 
 import os
 import re
+import sys
+from collections import defaultdict
 from functools import partial
 
 import sgtk
@@ -26,79 +28,49 @@ __contact__ = "https://www.linkedin.com/in/diegogh/"
 
 HookBaseClass = sgtk.get_hook_baseclass()
 
+# used to make sure asset names are alphanumeric, a requirement for the 'name'
+# field
+ALPHANUMERIC_REGEX = re.compile(r"[\W_]+", re.UNICODE)
 
-def all_ascendants(node, result=None):
-    if result is None:
-        result = []
-    try:
-        result.append(node.parent())
-        all_ascendants(node.parent(), result=result)
-    except RuntimeError:
-        pass
+# node type names compared for every node of the document during collection,
+# interned so that the comparison is an identity check whenever Rumba hands
+# back interned strings as well
+GEOMETRY_TYPE_NAME = sys.intern("Geometry")
+ASSET_TYPE_NAME = sys.intern("Asset")
 
-    return result
 
+def find_geometry_nodes_by_asset():
+    active_document = rumba.active_document()
 
-def is_node_visible(node):
-    nodes = [node] + all_ascendants(node)
-    for node in nodes:
-        if node.has_plug("show"):
-            if not node.show.as_bool():
-                return False
-    return True
-
-
-def find_nodes_with_plug(node, plug_name, type_names=None, results=None):
-    if results is None:
-        results = []
-
-    if node.has_plug(plug_name):
-        # if types were specified filter by them
-        if (type_names and node.type_name() in type_names) or type_names is None:
-            results.append(node)
-
-    for child_node in node.children():
-        find_nodes_with_plug(
-            child_node, plug_name, type_names=type_names, results=results
-        )
-
-    return results
-
-
-def find_nodes_of_type(node=None, type_names=None, results=None):
-    if node is None:
-        node = rumba.active_document()
-
-    if results is None:
-        results = []
-
-    # if types were specified filter by them
-    if (type_names and node.type_name() in type_names) or type_names is None:
-        results.append(node)
-
-    for child_node in node.children():
-        find_nodes_of_type(child_node, type_names=type_names, results=results)
+    if not active_document:
+        return {}
 
-    return results
+    by_asset_node = defaultdict(list)
 
+    # a single walk over the document, carrying down the name of the closest
+    # Asset node above each node. Hidden nodes are not descended into, so all
+    # the geometry nodes reached are visible.
+    stack = [(active_document, None)]
+    stack_pop = stack.pop
+    stack_extend = stack.extend
+    while stack:
+        node, asset_name = stack_pop()
 
-def find_geometry_nodes_by_asset():
-    active_document = rumba.active_document()
+        has_show = node.has_plug("show")
+        if has_show and not node.show.as_bool():
+            continue
 
-    nodes = find_nodes_with_plug(active_document, "show", type_names=["Geometry"])
-    nodes = [node for node in nodes if is_node_visible(node)]
+        type_name = node.type_name()
+        if type_name == GEOMETRY_TYPE_NAME:
+            if has_show and asset_name is not None:
+                by_asset_node[asset_name].append(node)
+        elif type_name == ASSET_TYPE_NAME:
+            asset_name = node.asset_name.as_string()
 
-    by_asset_node = {}
-    for node in nodes:
-        for p in all_ascendants(node):
-            if p.type_name() == "Asset":
-                pname = p.asset_name.as_string()
-                if pname not in by_asset_node.keys():
-                    by_asset_node[pname] = []
-                by_asset_node[pname].append(node)
-                break
+        stack_extend((child, asset_name) for child in reversed(node.children()))
 
-    return by_asset_node
+    # callers expect a plain dictionary, missing assets should not be created
+    return dict(by_asset_node)
 
 
 class RumbaSessionCollector(HookBaseClass):
@@ -166,6 +138,9 @@ class RumbaSessionCollector(HookBaseClass):
         """
         items = []
 
+        # templates could have changed since the last collection
+        self._work_templates = {}
+
         # create an item representing the current rumba session
         session_item = self.collect_current_rumba_session(settings, parent_item)
         if session_item:
@@ -173,39 +148,54 @@ class RumbaSessionCollector(HookBaseClass):
 
             collect_individual_assets = settings.get("Collect Individual Assets").value
             self.parent.logger.debug(
-                "Collect Individual Assets: %s" % collect_individual_assets
+                "Collect Individual Assets: %s", collect_individual_assets
             )
 
+            # the three asset collectors work on the same geometry nodes, so
+            # walk the document only once for all of them. When there are no
+            # visible assets there is nothing for them to collect. The assets
+            # are snapshot in a list once so all of them iterate them in the
+            # same order.
+            asset_items = None
             if collect_individual_assets:
-                usd_asset_items = self.collect_rumba_usd_assets(settings, session_item)
-                if usd_asset_items:
-                    items.extend(usd_asset_items)
-            else:
+                asset_items = list(find_geometry_nodes_by_asset().items())
+                if not asset_items:
+                    self.logger.debug("No visible assets found to collect.")
+
+            if not collect_individual_assets:
                 usd_scene_item = self.collect_rumba_usd_scene(settings, session_item)
                 if usd_scene_item:
                     items.append(usd_scene_item)
+            elif asset_items:
+                usd_asset_items = self.collect_rumba_usd_assets(
+                    settings, session_item, asset_items=asset_items
+                )
+                if usd_asset_items:
+                    items.extend(usd_asset_items)
 
-            if collect_individual_assets:
+            if not collect_individual_assets:
+                fbx_scene_item = self.collect_rumba_fbx_scene(settings, session_item)
+                if fbx_scene_item:
+                    items.append(fbx_scene_item)
+            elif asset_items:
                 fbx_asset_animation_items = self.collect_rumba_fbx_assets(
-                    settings, session_item
+                    settings, session_item, asset_items=asset_items
                 )
                 if fbx_asset_animation_items:
                     items.extend(fbx_asset_animation_items)
-            else:
-                fbx_scene_item = self.collect_rumba_fbx_scene(settings, session_item)
-                if fbx_scene_item:
-                    items.append(fbx_scene_item)
 
-            if collect_individual_assets:
-                abc_asset_items = self.collect_rumba_abc_assets(settings, session_item)
-                if abc_asset_items:
-                    items.extend(abc_asset_items)
-            else:
+            if not collect_individual_assets:
                 abc_animation_item = self.collect_rumba_abc_scene(
                     settings, session_item
                 )
                 if abc_animation_item:
                     items.append(abc_animation_item)
+            elif asset_items:
+                abc_asset_items = self.collect_rumba_abc_assets(
+                    settings, session_item, asset_items=asset_items
+                )
+                if abc_asset_items:
+                    items.extend(abc_asset_items)
 
             rumba_node_item = (
                 self.collect_rumba_selection_as_nodes(settings, session_item) or []
@@ -215,6 +205,94 @@ class RumbaSessionCollector(HookBaseClass):
 
         return items
 
+    def _get_work_template(self, settings):
+        """
+        Returns the work template configured for this collector, if any.
+
+        :param dict settings: Configured settings for this collector
+
+        :returns: Template instance or None
+        """
+        work_template_setting = settings.get("Work Template")
+        if not work_template_setting:
+            return None
+
+        # all the collected items use the same template, so only look it up
+        # once per collection, see process_current_session
+        work_templates = getattr(self, "_work_templates", None)
+        if work_templates is None:
+            work_templates = self._work_templates = {}
+
+        template_name = work_template_setting.value
+        if template_name not in work_templates:
+            work_templates[template_name] = self.parent.engine.get_template_by_name(
+                template_name
+            )
+
+        return work_templates[template_name]
+
+    def _icon_path(self, icon_name):
+        """
+        Returns the path to the given icon, found in the icons folder. Paths are
+        cached as they do not change for the lifetime of the hook.
+
+        :param str icon_name: Name of the icon, without extension
+
+        :returns: Path to the icon
+        """
+        icon_paths = getattr(self, "_icon_paths", None)
+        if icon_paths is None:
+            icon_paths = self._icon_paths = {}
+
+        icon_path = icon_paths.get(icon_name)
+        if icon_path is None:
+            icon_path = icon_paths[icon_name] = os.path.join(
+                self.disk_location, os.pardir, "icons", "%s.png" % icon_name
+            )
+
+        return icon_path
+
+    def _make_publish_item(
+        self,
+        parent_item,
+        item_type,
+        type_display,
+        display_name,
+        icon_name,
+        work_template,
+    ):
+        """
+        Creates a publish item with its icon, work template and publish type
+        already set.
+
+        :param parent_item: Parent Item instance
+        :param str item_type: Type of the item, ie. rumba.session
+        :param str type_display: Display name of the type, also used as the
+            publish type
+        :param str display_name: Display name of the item
+        :param str icon_name: Name of the icon, without extension, found in the
+            icons folder
+        :param work_template: Work template to store on the item, as returned
+            by _get_work_template
+
+        :returns: The created item
+        """
+        item = parent_item.create_item(item_type, type_display, display_name)
+
+        # get the icon path to display for this item
+        item.set_icon_from_path(self._icon_path(icon_name))
+
+        # store the template on the item for use by publish plugins. we
+        # can't evaluate the fields here because there's no guarantee the
+        # current session path won't change once the item has been created.
+        # the attached publish plugins will need to resolve the fields at
+        # execution time.
+        item.properties.update(
+            {"work_template": work_template, "publish_type": type_display}
+        )
+
+        return item
+
     def collect_current_rumba_session(self, settings, parent_item):
         """
         Creates an item that represents the current rumba session.
@@ -241,33 +319,15 @@ class RumbaSessionCollector(HookBaseClass):
             display_name = "Current Rumba Document"
 
         # create the session item for the publish hierarchy
-        session_item = parent_item.create_item(
-            "rumba.session", "Rumba Document", display_name
+        session_item = self._make_publish_item(
+            parent_item,
+            "rumba.session",
+            "Rumba Document",
+            display_name,
+            "rumba",
+            self._get_work_template(settings),
         )
 
-        # get the icon path to display for this item
-        icon_path = os.path.join(self.disk_location, os.pardir, "icons", "rumba.png")
-        session_item.set_icon_from_path(icon_path)
-
-        # if a work template is defined, add it to the item properties so
-        # that it can be used by attached publish plugins
-        work_template_setting = settings.get("Work Template")
-
-        if work_template_setting:
-
-            work_template = publisher.engine.get_template_by_name(
-                work_template_setting.value
-            )
-
-            # store the template on the item for use by publish plugins. we
-            # can't evaluate the fields here because there's no guarantee the
-            # current session path won't change once the item has been created.
-            # the attached publish plugins will need to resolve the fields at
-            # execution time.
-            session_item.properties["work_template"] = work_template
-            session_item.properties["publish_type"] = "Rumba Document"
-            self.logger.debug("Work template defined for Rumba collection.")
-
         self.logger.info("Collected current Rumba scene")
 
         return session_item
@@ -281,8 +341,6 @@ class RumbaSessionCollector(HookBaseClass):
         :returns: Item of type rumba.animation.usd
         """
 
-        publisher = self.parent
-
         # get the path to the current file
         path = _session_path()
 
@@ -293,27 +351,14 @@ class RumbaSessionCollector(HookBaseClass):
         display_name = "Scene as USD"
 
         # create the session item for the publish hierarchy
-        item = parent_item.create_item("rumba.animation.usd", "USD File", display_name)
-
-        # get the icon path to display for this item
-        icon_path = os.path.join(self.disk_location, os.pardir, "icons", "usd.png")
-        item.set_icon_from_path(icon_path)
-
-        # if a work template is defined, add it to the item properties so
-        # that it can be used by attached publish plugins
-        work_template_setting = settings.get("Work Template")
-        if work_template_setting:
-            work_template = publisher.engine.get_template_by_name(
-                work_template_setting.value
-            )
-
-            # store the template on the item for use by publish plugins. we
-            # can't evaluate the fields here because there's no guarantee the
-            # current session path won't change once the item has been created.
-            # the attached publish plugins will need to resolve the fields at
-            # execution time.
-            item.properties["work_template"] = work_template
-            item.properties["publish_type"] = "USD File"
+        item = self._make_publish_item(
+            parent_item,
+            "rumba.animation.usd",
+            "USD File",
+            display_name,
+            "usd",
+            self._get_work_template(settings),
+        )
 
         self.logger.info("Collected Rumba scene as USD for publishing.")
 
@@ -328,8 +373,6 @@ class RumbaSessionCollector(HookBaseClass):
         :returns: Item of type rumba.animation.fbx
         """
 
-        publisher = self.parent
-
         # get the path to the current file
         path = _session_path()
 
@@ -340,44 +383,32 @@ class RumbaSessionCollector(HookBaseClass):
         display_name = "Scene Animation as FBX"
 
         # create the session item for the publish hierarchy
-        item = parent_item.create_item("rumba.animation.fbx", "FBX File", display_name)
-
-        # get the icon path to display for this item
-        icon_path = os.path.join(self.disk_location, os.pardir, "icons", "fbx.png")
-        item.set_icon_from_path(icon_path)
-
-        # if a work template is defined, add it to the item properties so
-        # that it can be used by attached publish plugins
-        work_template_setting = settings.get("Work Template")
-        if work_template_setting:
-            work_template = publisher.engine.get_template_by_name(
-                work_template_setting.value
-            )
-
-            # store the template on the item for use by publish plugins. we
-            # can't evaluate the fields here because there's no guarantee the
-            # current session path won't change once the item has been created.
-            # the attached publish plugins will need to resolve the fields at
-            # execution time.
-            item.properties["work_template"] = work_template
-            item.properties["publish_type"] = "FBX File"
+        item = self._make_publish_item(
+            parent_item,
+            "rumba.animation.fbx",
+            "FBX File",
+            display_name,
+            "fbx",
+            self._get_work_template(settings),
+        )
 
         self.logger.info("Collected Rumba animation as FBX for publishing.")
 
         return item
 
-    def collect_rumba_fbx_assets(self, settings, parent_item):
+    def collect_rumba_fbx_assets(self, settings, parent_item, asset_items=None):
         """
         Creates an item that represents the publishing of asset animation
         as a USD file.
 
         :param parent_item: Parent Item instance
+        :param asset_items: Optional list of (asset name, visible geometry
+            nodes) tuples, as returned by find_geometry_nodes_by_asset, to
+            avoid walking the document again.
 
         :returns: Item of type rumba.animation.alembic_cache
         """
 
-        publisher = self.parent
-
         # get the path to the current file
         path = _session_path()
 
@@ -385,64 +416,53 @@ class RumbaSessionCollector(HookBaseClass):
             # no document is active, so nothing to see here!
             return
 
-        by_asset_node = find_geometry_nodes_by_asset()
+        if asset_items is None:
+            asset_items = list(find_geometry_nodes_by_asset().items())
+
+        # resolve the work template once for all the asset items
+        work_template = self._get_work_template(settings)
 
         items = []
-        for asset_name, nodes in by_asset_node.items():
+        for asset_name, nodes in asset_items:
 
             # let's filter the asset name so we make sure it is
             # alphanumeric, a requirement for the 'name' field
-            alphanumeric = re.compile(r"[\W_]+", re.UNICODE)
-            asset_name = alphanumeric.sub("", asset_name)
+            asset_name = ALPHANUMERIC_REGEX.sub("", asset_name)
 
             display_name = "%s FBX Animation" % asset_name
 
             # create the session item for the publish hierarchy
-            item = parent_item.create_item(
-                "rumba.animation.fbx", "FBX File", display_name
+            item = self._make_publish_item(
+                parent_item,
+                "rumba.animation.fbx",
+                "FBX File",
+                display_name,
+                "fbx",
+                work_template,
             )
 
-            # get the icon path to display for this item
-            icon_path = os.path.join(self.disk_location, os.pardir, "icons", "fbx.png")
-            item.set_icon_from_path(icon_path)
-
-            # if a work template is defined, add it to the item properties so
-            # that it can be used by attached publish plugins
-            work_template_setting = settings.get("Work Template")
-            if work_template_setting:
-                work_template = publisher.engine.get_template_by_name(
-                    work_template_setting.value
-                )
-
-                # store the template on the item for use by publish plugins. we
-                # can't evaluate the fields here because there's no guarantee the
-                # current session path won't change once the item has been created.
-                # the attached publish plugins will need to resolve the fields at
-                # execution time.
-                item.properties["work_template"] = work_template
-                item.properties["publish_type"] = "FBX File"
-
-            item.properties["nodes"] = nodes
-
-            item.properties["extra_fields"] = {"name": asset_name}
-            self.logger.info("Asset '%s' collected for FBX publishings" % asset_name)
+            item.properties.update(
+                {"nodes": nodes, "extra_fields": {"name": asset_name}}
+            )
+            self.logger.info("Asset '%s' collected for FBX publishings", asset_name)
 
             items.append(item)
 
         return items
 
-    def collect_rumba_usd_assets(self, settings, parent_item):
+    def collect_rumba_usd_assets(self, settings, parent_item, asset_items=None):
         """
         Creates an item that represents the publishing of asset animation
         as a USD file.
 
         :param parent_item: Parent Item instance
+        :param asset_items: Optional list of (asset name, visible geometry
+            nodes) tuples, as returned by find_geometry_nodes_by_asset, to
+            avoid walking the document again.
 
         :returns: Item of type rumba.animation.alembic_cache
         """
 
-        publisher = self.parent
-
         # get the path to the current file
         path = _session_path()
 
@@ -450,64 +470,53 @@ class RumbaSessionCollector(HookBaseClass):
             # no document is active, so nothing to see here!
             return
 
-        by_asset_node = find_geometry_nodes_by_asset()
+        if asset_items is None:
+            asset_items = list(find_geometry_nodes_by_asset().items())
+
+        # resolve the work template once for all the asset items
+        work_template = self._get_work_template(settings)
 
         items = []
-        for asset_name, nodes in by_asset_node.items():
+        for asset_name, nodes in asset_items:
 
             # let's filter the asset name so we make sure it is
             # alphanumeric, a requirement for the 'name' field
-            alphanumeric = re.compile(r"[\W_]+", re.UNICODE)
-            asset_name = alphanumeric.sub("", asset_name)
+            asset_name = ALPHANUMERIC_REGEX.sub("", asset_name)
 
             display_name = "%s USD File" % asset_name
 
             # create the session item for the publish hierarchy
-            item = parent_item.create_item(
-                "rumba.animation.usd", "USD File", display_name
+            item = self._make_publish_item(
+                parent_item,
+                "rumba.animation.usd",
+                "USD File",
+                display_name,
+                "usd",
+                work_template,
             )
 
-            # get the icon path to display for this item
-            icon_path = os.path.join(self.disk_location, os.pardir, "icons", "usd.png")
-            item.set_icon_from_path(icon_path)
-
-            # if a work template is defined, add it to the item properties so
-            # that it can be used by attached publish plugins
-            work_template_setting = settings.get("Work Template")
-            if work_template_setting:
-                work_template = publisher.engine.get_template_by_name(
-                    work_template_setting.value
-                )
-
-                # store the template on the item for use by publish plugins. we
-                # can't evaluate the fields here because there's no guarantee the
-                # current session path won't change once the item has been created.
-                # the attached publish plugins will need to resolve the fields at
-                # execution time.
-                item.properties["work_template"] = work_template
-                item.properties["publish_type"] = "USD File"
-
-            item.properties["nodes"] = nodes
-
-            item.properties["extra_fields"] = {"name": asset_name}
-            self.logger.info("Asset '%s' collected for USD publishings" % asset_name)
+            item.properties.update(
+                {"nodes": nodes, "extra_fields": {"name": asset_name}}
+            )
+            self.logger.info("Asset '%s' collected for USD publishings", asset_name)
 
             items.append(item)
 
         return items
 
-    def collect_rumba_abc_assets(self, settings, parent_item):
+    def collect_rumba_abc_assets(self, settings, parent_item, asset_items=None):
         """
         Creates an item that represents the publishing of asset animation
         as an Alembic Cache file.
 
         :param parent_item: Parent Item instance
+        :param asset_items: Optional list of (asset name, visible geometry
+            nodes) tuples, as returned by find_geometry_nodes_by_asset, to
+            avoid walking the document again.
 
         :returns: Item of type rumba.animation.alembic_cache
         """
 
-        publisher = self.parent
-
         # get the path to the current file
         path = _session_path()
 
@@ -515,50 +524,36 @@ class RumbaSessionCollector(HookBaseClass):
             # no document is active, so nothing to see here!
             return
 
-        by_asset_node = find_geometry_nodes_by_asset()
+        if asset_items is None:
+            asset_items = list(find_geometry_nodes_by_asset().items())
+
+        # resolve the work template once for all the asset items
+        work_template = self._get_work_template(settings)
 
         items = []
-        for asset_name, nodes in by_asset_node.items():
+        for asset_name, nodes in asset_items:
 
             # let's filter the asset name so we make sure it is
             # alphanumeric, a requirement for the 'name' field
-            alphanumeric = re.compile(r"[\W_]+", re.UNICODE)
-            asset_name = alphanumeric.sub("", asset_name)
+            asset_name = ALPHANUMERIC_REGEX.sub("", asset_name)
 
             display_name = "%s Alembic Cache" % asset_name
 
             # create the session item for the publish hierarchy
-            item = parent_item.create_item(
-                "rumba.animation.alembic_cache", "Alembic Cache", display_name
+            item = self._make_publish_item(
+                parent_item,
+                "rumba.animation.alembic_cache",
+                "Alembic Cache",
+                display_name,
+                "alembic",
+                work_template,
             )
 
-            # get the icon path to display for this item
-            icon_path = os.path.join(
-                self.disk_location, os.pardir, "icons", "alembic.png"
+            item.properties.update(
+                {"nodes": nodes, "extra_fields": {"name": asset_name}}
             )
-            item.set_icon_from_path(icon_path)
-
-            # if a work template is defined, add it to the item properties so
-            # that it can be used by attached publish plugins
-            work_template_setting = settings.get("Work Template")
-            if work_template_setting:
-                work_template = publisher.engine.get_template_by_name(
-                    work_template_setting.value
-                )
-
-                # store the template on the item for use by publish plugins. we
-                # can't evaluate the fields here because there's no guarantee the
-                # current session path won't change once the item has been created.
-                # the attached publish plugins will need to resolve the fields at
-                # execution time.
-                item.properties["work_template"] = work_template
-                item.properties["publish_type"] = "Alembic Cache"
-
-            item.properties["nodes"] = nodes
-
-            item.properties["extra_fields"] = {"name": asset_name}
             self.logger.info(
-                "Asset '%s' collected for Alembic Cache publishings" % asset_name
+                "Asset '%s' collected for Alembic Cache publishings", asset_name
             )
 
             items.append(item)
@@ -575,8 +570,6 @@ class RumbaSessionCollector(HookBaseClass):
         :returns: Item of type rumba.animation.alembic_cache
         """
 
-        publisher = self.parent
-
         # get the path to the current file
         path = _session_path()
 
@@ -587,30 +580,15 @@ class RumbaSessionCollector(HookBaseClass):
         display_name = "Scene Alembic Cache"
 
         # create the session item for the publish hierarchy
-        item = parent_item.create_item(
-            "rumba.animation.alembic_cache", "Alembic Cache", display_name
+        item = self._make_publish_item(
+            parent_item,
+            "rumba.animation.alembic_cache",
+            "Alembic Cache",
+            display_name,
+            "alembic",
+            self._get_work_template(settings),
         )
 
-        # get the icon path to display for this item
-        icon_path = os.path.join(self.disk_location, os.pardir, "icons", "alembic.png")
-        item.set_icon_from_path(icon_path)
-
-        # if a work template is defined, add it to the item properties so
-        # that it can be used by attached publish plugins
-        work_template_setting = settings.get("Work Template")
-        if work_template_setting:
-            work_template = publisher.engine.get_template_by_name(
-                work_template_setting.value
-            )
-
-            # store the template on the item for use by publish plugins. we
-            # can't evaluate the fields here because there's no guarantee the
-            # current session path won't change once the item has been created.
-            # the attached publish plugins will need to resolve the fields at
-            # execution time.
-            item.properties["work_template"] = work_template
-            item.properties["publish_type"] = "Alembic Cache"
-
         self.logger.info("Collected Rumba animation as Alembic Cache for publishing.")
 
         return item
@@ -624,8 +602,6 @@ class RumbaSessionCollector(HookBaseClass):
         :returns: Item of type rumba.animation.alembic_cache
         """
 
-        publisher = self.parent
-
         # get the path to the current file
         path = _session_path()
 
@@ -642,8 +618,8 @@ class RumbaSessionCollector(HookBaseClass):
         node = selection[0]
         if node.is_referenced():
             self.logger.warning(
-                "Exporting of reference nodes is not supported in Rumba at the moment. The selected node `%s` won't be added for publishing."
-                % node.name()
+                "Exporting of reference nodes is not supported in Rumba at the moment. The selected node `%s` won't be added for publishing.",
+                node.name(),
             )
             return None
 
@@ -651,31 +627,21 @@ class RumbaSessionCollector(HookBaseClass):
         display_name = "Node: `%s`" % node.name()
 
         # create the session item for the publish hierarchy
-        item = parent_item.create_item("rumba.node", "Rumba Node", display_name)
-
-        # get the icon path to display for this item
-        icon_path = os.path.join(
-            self.disk_location, os.pardir, "icons", "rumbanode.png"
+        item = self._make_publish_item(
+            parent_item,
+            "rumba.node",
+            "Rumba Node",
+            display_name,
+            "rumbanode",
+            self._get_work_template(settings),
         )
-        item.set_icon_from_path(icon_path)
-
-        # if a work template is defined, add it to the item properties so
-        # that it can be used by attached publish plugins
-        work_template_setting = settings.get("Work Template")
-        if work_template_setting:
-            work_template = publisher.engine.get_template_by_name(
-                work_template_setting.value
-            )
 
-            # store the template on the item for use by publish plugins. we
-            # can't evaluate the fields here because there's no guarantee the
-            # current session path won't change once the item has been created.
-            # the attached publish plugins will need to resolve the fields at
-            # execution time.
-            item.properties["work_template"] = work_template
-            item.properties["publish_type"] = "Rumba Node"
-            item.properties["node_full_document_name"] = node.full_document_name()
-            item.properties["extra_fields"] = {"rumba.node.name": node_name}
+        item.properties.update(
+            {
+                "node_full_document_name": node.full_document_name(),
+                "extra_fields": {"rumba.node.name": node_name},
+            }
+        )
 
         self.logger.info(
             "Collected Selection as Rumba Nodes animation as Alembic Cache for publishing."
@@ -23,7 +23,6 @@ from sgtk.util.version import is_version_older
 from sgtk.util.filesystem import copy_file, ensure_folder_exists
 
 import rumba
-import rumba_alembic
 from rumbapy import widget, message_box, Progress
 
 __author__ = "Diego Garcia Huerta"
@@ -105,6 +104,8 @@ class RumbaAlembicCachePublishPlugin(HookBaseClass):
         return ["rumba.animation.alembic_cache"]
 
     def _export(self, settings, item, path):
+        # the exporter is only imported by sessions that publish Alembic caches
+        import rumba_alembic
 
         samples = []  # 1 sample per frame by default
 
@@ -22,8 +22,6 @@ from tempfile import NamedTemporaryFile
 from sgtk.util.version import is_version_older
 from sgtk.util.filesystem import copy_file, ensure_folder_exists
 
-import fbx
-
 from rumbapy import widget, message_box, Progress
 
 __author__ = "Diego Garcia Huerta"
@@ -103,19 +101,21 @@ class RumbaFBXPublishPlugin(HookBaseClass):
         return ["rumba.animation.fbx"]
 
     def _export(self, settings, item, path):
+        # the exporter is only imported by sessions that publish FBX files
+        import fbx
+
         nodes = []  # export all the assets
         frames = []  # export all the frames
         ascii = False  # we want a binary FBX file
-        export_namespaces = True
 
         # if no nodes are specified, the whole scene is exported
         nodes = item.properties.get("nodes", [])
         extra_fields = item.properties.get("extra_fields", {})
         name = extra_fields.get("name", "scene")
 
+        # namespaces are exported unless the setting turns them off
         namespace_setting = settings.get("Export Namespaces")
-        if namespace_setting and namespace_setting.value:
-            export_namespaces = namespace_setting.value
+        export_namespaces = bool(namespace_setting.value) if namespace_setting else True
 
         try:
             with Progress("Exporting %s as FBX..." % name) as progress:
@@ -13,8 +13,10 @@
 
 
 import os
+import logging
 import traceback
 import contextlib
+from collections import namedtuple
 
 import sgtk
 from sgtk import TankError
@@ -31,6 +33,13 @@ __contact__ = "https://www.linkedin.com/in/diegogh/"
 
 HookBaseClass = sgtk.get_hook_baseclass()
 
+# what the validation steps of an item need to know, gathered once per
+# validation instead of by each step
+PublishState = namedtuple("PublishState", ["path", "work_template", "publish_template"])
+
+# marks a publish template that has not been looked up yet
+_UNRESOLVED = object()
+
 
 class RumbaBasePublishPlugin(HookBaseClass):
     """
@@ -60,9 +69,15 @@ class RumbaBasePublishPlugin(HookBaseClass):
         contain simple html for formatting.
         """
 
+        # the description never changes, build it only the first time the
+        # publisher asks for it
+        description = getattr(self, "_description", None)
+        if description is not None:
+            return description
+
         loader_url = "https://support.shotgunsoftware.com/hc/en-us/articles/219033078"
 
-        return """
+        self._description = """
         %s. A <b>Publish</b> entry will be
         created in Shotgun which will include a reference to the file's current
         path on disk. If a publish template is configured, a copy of the
@@ -111,6 +126,8 @@ class RumbaBasePublishPlugin(HookBaseClass):
             loader_url,
         )
 
+        return self._description
+
     @property
     def settings(self):
         """
@@ -142,7 +159,7 @@ class RumbaBasePublishPlugin(HookBaseClass):
                 "description": "Template path for published %s files. Should"
                 "correspond to a template defined in "
                 "templates.yml." % self.type_description,
-            }
+            },
         }
 
         # update the base settings
@@ -198,14 +215,18 @@ class RumbaBasePublishPlugin(HookBaseClass):
         self.session_validate(settings, item)
 
         self.logger.info(
-            "Rumba '%s' plugin accepted to publish a %s"
-            % (self.name, self.type_description)
+            "Rumba '%s' plugin accepted to publish a %s",
+            self.name,
+            self.type_description,
         )
 
-        self.logger.info("Rumba '%s' plugin settings:" % (self.name))
+        # the settings are dumped for every accepted item, only do it when
+        # someone is going to read them
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Rumba '%s' plugin settings:", self.name)
 
-        for setting_name, setting in settings.items():
-            self.logger.info("\t%s: %s" % (setting_name, setting.value))
+            for setting_name, setting in settings.items():
+                self.logger.info("\t%s: %s", setting_name, setting.value)
 
         return {"accepted": True, "checked": True}
 
@@ -223,6 +244,14 @@ class RumbaBasePublishPlugin(HookBaseClass):
         """
         publisher = self.parent
 
+        # this plugin could have resolved the template to None already, which
+        # is a valid answer that does not need looking up again. It is kept in
+        # the plugin's local properties, other plugins acting on the item can
+        # have a template configured.
+        publish_template = item.local_properties.get("publish_template", _UNRESOLVED)
+        if publish_template is not _UNRESOLVED:
+            return publish_template
+
         publish_template = item.get_property("publish_template")
         if publish_template:
             return publish_template
@@ -242,6 +271,7 @@ class RumbaBasePublishPlugin(HookBaseClass):
 
         # cache it for later use
         item.properties["publish_template"] = publish_template
+        item.local_properties["publish_template"] = publish_template
 
         return publish_template
 
@@ -273,8 +303,9 @@ class RumbaBasePublishPlugin(HookBaseClass):
         # We need both work and publish template to be defined for template
         # support to be enabled.
         if work_template and publish_template:
-            if work_template.validate(path):
-                work_fields = work_template.get_fields(path)
+            fields = _get_template_fields(item, work_template, path)
+            if fields is not None:
+                work_fields = fields
 
             # add extra fields to be able to fulfill the publish
             # template if this is required
@@ -317,13 +348,14 @@ class RumbaBasePublishPlugin(HookBaseClass):
                 "The Rumba session has not been saved. Please save your session "
                 "before publishing."
             )
-            self.logger.error(error_msg, extra=_get_save_as_action())
+            self.logger.error(error_msg, extra=self.parent.engine.get_save_as_action())
             raise Exception(error_msg)
 
         # get the path in a normalized state. no trailing separator,
         # separators are appropriate for current OS, no double separators,
         # etc.
-        session_path = sgtk.util.ShotgunPath.normalize(session_path)
+        tk_rumba = self.parent.engine.tk_rumba
+        session_path = tk_rumba.normalize_session_path(item, session_path)
 
         # set the session path on the item for use by the base plugin validation
         # step. NOTE: this path could change prior to the publish phase.
@@ -331,22 +363,43 @@ class RumbaBasePublishPlugin(HookBaseClass):
 
         return True
 
-    def templates_validate(self, settings, item):
+    def _gather_publish_state(self, settings, item):
+        """
+        Gathers the path and templates of the item used by the validation
+        steps. session_validate must have run before.
+
+        :param settings: Dictionary of Settings. The keys are strings, matching
+            the keys returned in the settings property. The values are `Setting`
+            instances.
+        :param item: Item to process
+
+        :returns: A PublishState instance
+        """
+        return PublishState(
+            item.properties.get("path"),
+            item.properties.get("work_template"),
+            self.get_publish_template(settings, item),
+        )
+
+    def templates_validate(self, settings, item, state=None):
+        if state is None:
+            state = self._gather_publish_state(settings, item)
+
         valid = True
-        package_path = item.properties.get("path")
+        package_path = state.path
 
         # if the session item has a known work template, see if the path
         # matches. if not, warn the user and provide a way to save the file to
         # a different path
-        work_template = item.properties.get("work_template")
+        work_template = state.work_template
         if work_template:
-            if not work_template.validate(package_path):
+            if _get_template_fields(item, work_template, package_path) is None:
                 self.logger.warning(
                     (
                         "The current session does not match the configured work file "
                         "template. Please save your session before publishing."
                     ),
-                    extra=_get_save_as_action(),
+                    extra=self.parent.engine.get_save_as_action(),
                     valid=False,
                 )
             else:
@@ -356,7 +409,7 @@ class RumbaBasePublishPlugin(HookBaseClass):
             valid = False
 
         # publish template
-        publish_template = self.get_publish_template(settings, item)
+        publish_template = state.publish_template
         if publish_template:
             self.logger.debug("Session Publish template: %s " % publish_template)
         else:
@@ -365,23 +418,18 @@ class RumbaBasePublishPlugin(HookBaseClass):
 
         return valid
 
-    def version_validate(self, settings, item):
-        path = item.properties["path"]
+    def version_validate(self, settings, item, state=None):
+        path = state.path if state is not None else item.properties["path"]
 
         # ---- see if the version can be bumped post-publish
 
         # check to see if the next version of the work file already exists on
         # disk. if so, warn the user and provide the ability to jump to save
-        # to that version now
-        (next_version_path, version) = self._get_next_version_info(path, item)
-        if next_version_path and os.path.exists(next_version_path):
-
-            # determine the next available version_number. just keep asking for
-            # the next one until we get one that doesn't exist.
-            while os.path.exists(next_version_path):
-                (next_version_path, version) = self._get_next_version_info(
-                    next_version_path, item
-                )
+        # to that version now. Determine the next available version_number too.
+        tk_rumba = self.parent.engine.tk_rumba
+        versions = tk_rumba.find_next_free_version(self, path, item)
+        (next_version_path, free_version_path, version) = versions
+        if next_version_path and free_version_path != next_version_path:
 
             error_msg = "The next version of this file already exists on disk."
             self.logger.error(
@@ -391,7 +439,7 @@ class RumbaBasePublishPlugin(HookBaseClass):
                         "label": "Save to v%s" % (version,),
                         "tooltip": "Save to the next available version number, "
                         "v%s" % (version,),
-                        "callback": lambda: _save_session(next_version_path),
+                        "callback": lambda: _save_session(free_version_path),
                     }
                 },
             )
@@ -412,8 +460,11 @@ class RumbaBasePublishPlugin(HookBaseClass):
         """
 
         valid = self.session_validate(settings, item)
-        valid = valid and self.templates_validate(settings, item)
-        valid = valid and self.version_validate(settings, item)
+
+        # every validation step works on the same path and templates
+        state = self._gather_publish_state(settings, item)
+        valid = valid and self.templates_validate(settings, item, state=state)
+        valid = valid and self.version_validate(settings, item, state=state)
 
         # run the base class validation
         return valid and super(RumbaBasePublishPlugin, self).validate(settings, item)
@@ -456,15 +507,14 @@ class RumbaBasePublishPlugin(HookBaseClass):
 
         for work_file in work_files:
 
-            if not work_template.validate(work_file):
+            work_fields = _get_template_fields(item, work_template, work_file)
+            if work_fields is None:
                 self.logger.warning(
                     "Work file '%s' did not match work template '%s'. "
                     "Publishing in place." % (work_file, work_template)
                 )
                 return
 
-            work_fields = work_template.get_fields(work_file)
-
             # add extra fields to be able to fulfill the publish
             # template if this is required
             if item.properties.get("extra_fields"):
@@ -551,6 +601,28 @@ def _session_path():
     return path
 
 
+def _get_template_fields(item, template, path):
+    """
+    Return a copy of the fields of the given path for the given template, that
+    callers are free to update, or None if the path does not match the
+    template. Results are cached on the item, for the plugin, as the same
+    paths are matched against the same templates at every step of a publish.
+    """
+    template_fields = item.local_properties.get("template_fields")
+    if template_fields is None:
+        template_fields = item.local_properties["template_fields"] = {}
+
+    key = (template, path)
+    if key not in template_fields:
+        template_fields[key] = template.validate_and_get_fields(path)
+
+    fields = template_fields[key]
+    if fields is None:
+        return None
+
+    return dict(fields)
+
+
 def _save_session(path):
     """
     Save the current session to the supplied path.
@@ -564,32 +636,3 @@ def _save_session(path):
     if active_doc:
         main_window = rumbapy.widget("MainWindow")
         main_window.save_at(path)
-
-
-def _get_save_as_action():
-    """
-    Simple helper for returning a log action dict for saving the session
-    """
-
-    engine = sgtk.platform.current_engine()
-
-    callback = _save_as
-
-    # if workfiles2 is configured, use that for file save
-    if "tk-multi-workfiles2" in engine.apps:
-        app = engine.apps["tk-multi-workfiles2"]
-        if hasattr(app, "show_file_save_dlg"):
-            callback = app.show_file_save_dlg
-
-    return {
-        "action_button": {
-            "label": "Save As...",
-            "tooltip": "Save the current session",
-            "callback": callback,
-        }
-    }
-
-
-def _save_as():
-    main_window = rumbapy.widget("MainWindow")
-    main_window.save_as()
@@ -17,7 +17,6 @@ import os
 import sgtk
 from sgtk.util.filesystem import ensure_folder_exists
 
-import fbx
 import rumba
 
 __author__ = "Diego Garcia Huerta"
@@ -218,9 +218,18 @@ class RumbaSessionPublishPlugin(HookBaseClass):
         publish_template_setting = settings.get("Publish Template")
 
         if publish_template_setting and publish_template_setting.value:
-            publish_template = publisher.engine.get_template_by_name(
-                publish_template_setting.value
-            )
+            # the template registry is only looked up once per template name
+            # for all the items this plugin publishes
+            templates = getattr(self, "_templates", None)
+            if templates is None:
+                templates = self._templates = {}
+
+            template_name = publish_template_setting.value
+            publish_template = templates.get(template_name)
+            if publish_template is None:
+                publish_template = publisher.engine.get_template_by_name(template_name)
+                templates[template_name] = publish_template
+
             if not publish_template:
                 raise TankError(
                     "Missing Publish Template in templates.yml: %s "
@@ -243,13 +252,14 @@ class RumbaSessionPublishPlugin(HookBaseClass):
                 "The Rumba session has not been saved. Please save your session "
                 "before publishing."
             )
-            self.logger.error(error_msg, extra=_get_save_as_action())
+            self.logger.error(error_msg, extra=self.parent.engine.get_save_as_action())
             raise Exception(error_msg)
 
         # get the path in a normalized state. no trailing separator,
         # separators are appropriate for current OS, no double separators,
         # etc.
-        session_path = sgtk.util.ShotgunPath.normalize(session_path)
+        tk_rumba = self.parent.engine.tk_rumba
+        session_path = tk_rumba.normalize_session_path(item, session_path)
 
         # set the session path on the item for use by the base plugin validation
         # step. NOTE: this path could change prior to the publish phase.
@@ -271,7 +281,7 @@ class RumbaSessionPublishPlugin(HookBaseClass):
                         "The current session does not match the configured work file "
                         "template. Please save your session before publishing."
                     ),
-                    extra=_get_save_as_action(),
+                    extra=self.parent.engine.get_save_as_action(),
                 )
             else:
                 self.logger.debug("Work template configured and matches session file.")
@@ -306,16 +316,11 @@ class RumbaSessionPublishPlugin(HookBaseClass):
 
         # check to see if the next version of the work file already exists on
         # disk. if so, warn the user and provide the ability to jump to save
-        # to that version now
-        (next_version_path, version) = self._get_next_version_info(path, item)
-        if next_version_path and os.path.exists(next_version_path):
-
-            # determine the next available version_number. just keep asking for
-            # the next one until we get one that doesn't exist.
-            while os.path.exists(next_version_path):
-                (next_version_path, version) = self._get_next_version_info(
-                    next_version_path, item
-                )
+        # to that version now. Determine the next available version_number too.
+        tk_rumba = self.parent.engine.tk_rumba
+        versions = tk_rumba.find_next_free_version(self, path, item)
+        (next_version_path, free_version_path, version) = versions
+        if next_version_path and free_version_path != next_version_path:
 
             error_msg = "The next version of this file already exists on disk."
             self.logger.error(
@@ -325,7 +330,7 @@ class RumbaSessionPublishPlugin(HookBaseClass):
                         "label": "Save to v%s" % (version,),
                         "tooltip": "Save to the next available version number, "
                         "v%s" % (version,),
-                        "callback": lambda: _save_session(next_version_path),
+                        "callback": lambda: _save_session(free_version_path),
                     }
                 },
             )
@@ -345,8 +350,11 @@ class RumbaSessionPublishPlugin(HookBaseClass):
         """
 
         # get the path in a normalized state. no trailing separator, separators
-        # are appropriate for current os, no double separators, etc.
-        path = sgtk.util.ShotgunPath.normalize(_session_path())
+        # are appropriate for current os, no double separators, etc. The path
+        # normalized during validation is reused if the session was not saved
+        # somewhere else since.
+        tk_rumba = self.parent.engine.tk_rumba
+        path = tk_rumba.normalize_session_path(item, _session_path())
 
         # ensure the session is saved
         _save_session(path)
@@ -380,19 +388,6 @@ class RumbaSessionPublishPlugin(HookBaseClass):
         self._save_to_next_version(item.properties["path"], item, _save_session)
 
 
-def _find_nodes_with_reference(node, results=None):
-    if results is None:
-        results = []
-
-    if node.reference_filename():
-        results.append(node)
-
-    for child_node in node.children():
-        _find_nodes_with_reference(child_node, results=results)
-
-    return results
-
-
 def _rumba_find_additional_session_dependencies():
     """
     Find additional dependencies from the session
@@ -402,12 +397,25 @@ def _rumba_find_additional_session_dependencies():
 
     additional_dependencies = []
     active_document = rumba.active_document()
-    if active_document:
-        nodes = _find_nodes_with_reference(active_document) or []
-        for node in nodes:
-            ref_path = node.reference_filename()
-            if ref_path:
-                additional_dependencies.append(ref_path)
+    if not active_document:
+        return additional_dependencies
+
+    # walk the document with an explicit stack rather than recursion, asking
+    # each node for its reference only once. Children are pushed reversed so
+    # nodes are still visited in depth-first order. A file referenced by many
+    # nodes is only a dependency once.
+    seen = set()
+    append = additional_dependencies.append
+    stack = [active_document]
+    stack_pop = stack.pop
+    stack_extend = stack.extend
+    while stack:
+        node = stack_pop()
+        ref_path = node.reference_filename()
+        if ref_path and ref_path not in seen:
+            seen.add(ref_path)
+            append(ref_path)
+        stack_extend(reversed(node.children()))
 
     return additional_dependencies
 
@@ -437,33 +445,3 @@ def _save_session(path):
     if active_doc:
         main_window = rumbapy.widget("MainWindow")
         main_window.save_at(path)
-
-
-# TODO: method duplicated in all the rumba hooks
-def _get_save_as_action():
-    """
-    Simple helper for returning a log action dict for saving the session
-    """
-
-    engine = sgtk.platform.current_engine()
-
-    callback = _save_as
-
-    # if workfiles2 is configured, use that for file save
-    if "tk-multi-workfiles2" in engine.apps:
-        app = engine.apps["tk-multi-workfiles2"]
-        if hasattr(app, "show_file_save_dlg"):
-            callback = app.show_file_save_dlg
-
-    return {
-        "action_button": {
-            "label": "Save As...",
-            "tooltip": "Save the current session",
-            "callback": callback,
-        }
-    }
-
-
-def _save_as():
-    main_window = rumbapy.widget("MainWindow")
-    main_window.save_as()
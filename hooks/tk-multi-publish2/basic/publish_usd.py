@@ -13,6 +13,7 @@
 
 
 import os
+import time
 import traceback
 import contextlib
 
@@ -24,7 +25,6 @@ from sgtk.util.filesystem import copy_file, ensure_folder_exists
 
 import rumba
 from rumbapy import widget, action, message_box, Progress
-from rumba_Usd import export_to_Usd
 
 __author__ = "Diego Garcia Huerta"
 __contact__ = "https://www.linkedin.com/in/diegogh/"
@@ -32,6 +32,10 @@ __contact__ = "https://www.linkedin.com/in/diegogh/"
 
 HookBaseClass = sgtk.get_hook_baseclass()
 
+# minimum time in seconds between two progress updates during an export, the
+# exporter reports progress far more often than the dialog needs repainting
+PROGRESS_UPDATE_INTERVAL = 0.05
+
 
 class RumbaUSDPublishPlugin(HookBaseClass):
     """
@@ -65,13 +69,17 @@ class RumbaUSDPublishPlugin(HookBaseClass):
         return ["rumba.animation.usd"]
 
     def _export(self, settings, item, path):
+        # the USD exporter is imported when first needed, importing it sets up
+        # Rumba's USD support, which sessions that never publish USD skip
+        from rumba_Usd import export_to_Usd
+
         nodes = item.properties.get("nodes", [])
         extra_fields = item.properties.get("extra_fields", {})
         name = extra_fields.get("name", "scene")
 
         try:
             with Progress("Exporting %s to Usd..." % name) as progress:
-                export_to_Usd(path, nodes, [], progress.update)
+                export_to_Usd(path, nodes, [], _throttled(progress.update))
         except RuntimeError as error:
             message_box(
                 "Error exporting to file {}:\n{}".format(path, error),
@@ -79,3 +87,21 @@ class RumbaUSDPublishPlugin(HookBaseClass):
                 widget=widget("MainWindow"),
                 level="error",
             )
+
+
+def _throttled(callback, interval=PROGRESS_UPDATE_INTERVAL):
+    """
+    Return a wrapper of the given progress callback that only forwards the
+    calls made at least `interval` seconds after the last forwarded one.
+    """
+    monotonic = time.monotonic
+    last_call = [None]
+
+    def throttled_callback(*args, **kwargs):
+        now = monotonic()
+        if last_call[0] is not None and now - last_call[0] < interval:
+            return
+        last_call[0] = now
+        return callback(*args, **kwargs)
+
+    return throttled_callback
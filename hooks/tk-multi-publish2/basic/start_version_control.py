@@ -145,7 +145,8 @@ class RumbaStartVersionControlPlugin(HookBaseClass):
             # provide a save button. the session will need to be saved before
             # validation will succeed.
             self.logger.warn(
-                "The Rumba session has not been saved.", extra=_get_save_as_action()
+                "The Rumba session has not been saved.",
+                extra=self.parent.engine.get_save_as_action(),
             )
 
         self.logger.info(
@@ -178,7 +179,7 @@ class RumbaStartVersionControlPlugin(HookBaseClass):
             # the session still requires saving. provide a save button.
             # validation fails
             error_msg = "The Rumba session has not been saved."
-            self.logger.error(error_msg, extra=_get_save_as_action())
+            self.logger.error(error_msg, extra=self.parent.engine.get_save_as_action())
             raise Exception(error_msg)
 
         # NOTE: If the plugin is attached to an item, that means no version
@@ -191,7 +192,7 @@ class RumbaStartVersionControlPlugin(HookBaseClass):
         version_path = publisher.util.get_version_path(path, "v001")
         if os.path.exists(version_path):
             error_msg = "A file already exists with a version number. Please choose another name."
-            self.logger.error(error_msg, extra=_get_save_as_action())
+            self.logger.error(error_msg, extra=self.parent.engine.get_save_as_action())
             raise Exception(error_msg)
 
         return True
@@ -300,36 +301,6 @@ def _save_session(path):
         main_window.save_at(path)
 
 
-# TODO: method duplicated in all the rumba hooks
-def _get_save_as_action():
-    """
-    Simple helper for returning a log action dict for saving the session
-    """
-
-    engine = sgtk.platform.current_engine()
-
-    callback = _save_as
-
-    # if workfiles2 is configured, use that for file save
-    if "tk-multi-workfiles2" in engine.apps:
-        app = engine.apps["tk-multi-workfiles2"]
-        if hasattr(app, "show_file_save_dlg"):
-            callback = app.show_file_save_dlg
-
-    return {
-        "action_button": {
-            "label": "Save As...",
-            "tooltip": "Save the current session",
-            "callback": callback,
-        }
-    }
-
-
-def _save_as():
-    main_window = rumbapy.widget("MainWindow")
-    main_window.save_as()
-
-
 def _get_version_docs_action():
     """
     Simple helper for returning a log action to show version docs
@@ -12,6 +12,8 @@
 # ----------------------------------------------------------------------------
 
 
+import contextlib
+
 import sgtk
 from sgtk import TankError
 
@@ -63,9 +65,28 @@ class FrameOperation(HookBaseClass):
             start = int(in_frame)
             end = int(out_frame)
 
-            rumba.modify_begin("Shotgun Update Frame Range")
-            active_doc.start_frame.set_value(start)
-            active_doc.end_frame.set_value(end)
-            active_doc.range_start_frame.set_value(start)
-            active_doc.range_end_frame.set_value(end)
-            rumba.modify_end()
+            # resolve the plugs before opening the modify block, so only the
+            # actual writes happen while Rumba is modifying the document
+            start_frame = active_doc.start_frame
+            end_frame = active_doc.end_frame
+            range_start_frame = active_doc.range_start_frame
+            range_end_frame = active_doc.range_end_frame
+
+            with _rumba_modify("Shotgun Update Frame Range"):
+                start_frame.set_value(start)
+                end_frame.set_value(end)
+                range_start_frame.set_value(start)
+                range_end_frame.set_value(end)
+
+
+@contextlib.contextmanager
+def _rumba_modify(name):
+    """
+    Context manager grouping the document changes made within it in a single
+    Rumba modification, which is always closed even if a change fails.
+    """
+    rumba.modify_begin(name)
+    try:
+        yield
+    finally:
+        rumba.modify_end()
@@ -26,6 +26,9 @@ __contact__ = "https://www.linkedin.com/in/diegogh/"
 
 HookClass = sgtk.get_hook_baseclass()
 
+# file name Rumba reports for a document that was never saved
+UNTITLED_FILENAME = "untitled"
+
 
 class SceneOperation(HookClass):
     """
@@ -49,8 +52,7 @@ class SceneOperation(HookClass):
                                      file path as a String
                     all others     - None
         """
-        active_doc = rumba.active_document()
-
+        # the active document is only looked up by the operations that need it
         if operation == "current_path":
             current_project_filename = rumba.active_document_filename()
             return current_project_filename
@@ -59,7 +61,10 @@ class SceneOperation(HookClass):
             rumba.load_document(file_path)
 
         elif operation == "save":
-            if active_doc:
-                current_project_filename = rumba.active_document_filename()
-                if current_project_filename != "untitled":
+            # an unsaved document has nowhere to be saved to, no need to look
+            # it up
+            current_project_filename = rumba.active_document_filename()
+            if current_project_filename != UNTITLED_FILENAME:
+                active_doc = rumba.active_document()
+                if active_doc:
                     active_doc.write(current_project_filename)
@@ -13,3 +13,6 @@
 
 
 from .menu_generation import MenuGenerator, can_create_menu
+from .save_actions import get_save_as_callback, save_as
+from .session import normalize_session_path
+from .versions import find_next_free_version
@@ -0,0 +1,48 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) 2021, Diego Garcia Huerta.
+#
+# Your use of this software as distributed in this GitHub repository, is
+# governed by the MIT License
+#
+# Your use of the Shotgun Pipeline Toolkit is governed by the applicable
+# license agreement between you and Autodesk / Shotgun.
+#
+# Read LICENSE and SHOTGUN_LICENSE for full details about the licenses that
+# pertain to this software.
+# ----------------------------------------------------------------------------
+
+
+"""
+Save actions shared by the Rumba hooks, offered from their log output when the
+session needs saving.
+
+"""
+
+import rumbapy
+
+
+__author__ = "Diego Garcia Huerta"
+__contact__ = "https://www.linkedin.com/in/diegogh/"
+
+
+def save_as():
+    """
+    Shows the Rumba dialog to save the current session.
+    """
+    main_window = rumbapy.widget("MainWindow")
+    main_window.save_as()
+
+
+def get_save_as_callback(engine):
+    """
+    Returns the callback used to save the current session, the workfiles2 save
+    dialog if it is available, otherwise the Rumba one.
+
+    :param engine: The engine the apps are looked up from.
+    """
+    # if workfiles2 is configured, use that for file save
+    app = engine.apps.get("tk-multi-workfiles2")
+    if app and hasattr(app, "show_file_save_dlg"):
+        return app.show_file_save_dlg
+
+    return save_as
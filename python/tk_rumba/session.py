@@ -0,0 +1,48 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) 2021, Diego Garcia Huerta.
+#
+# Your use of this software as distributed in this GitHub repository, is
+# governed by the MIT License
+#
+# Your use of the Shotgun Pipeline Toolkit is governed by the applicable
+# license agreement between you and Autodesk / Shotgun.
+#
+# Read LICENSE and SHOTGUN_LICENSE for full details about the licenses that
+# pertain to this software.
+# ----------------------------------------------------------------------------
+
+
+"""
+Session helpers shared by the Rumba publish plugins.
+
+"""
+
+import sgtk
+
+
+__author__ = "Diego Garcia Huerta"
+__contact__ = "https://www.linkedin.com/in/diegogh/"
+
+
+def normalize_session_path(item, session_path):
+    """
+    Return the given session path normalized, reusing the normalized path
+    stored on the item while the session path is the same. The session can be
+    saved somewhere else between validations.
+
+    :param item: Item to process
+    :param str session_path: Path of the current session
+
+    :returns: The normalized session path
+    """
+    raw_session_path, normalized_session_path = item.properties.get(
+        "normalized_session_path", (None, None)
+    )
+    if raw_session_path != session_path:
+        normalized_session_path = sgtk.util.ShotgunPath.normalize(session_path)
+        item.properties["normalized_session_path"] = (
+            session_path,
+            normalized_session_path,
+        )
+
+    return normalized_session_path
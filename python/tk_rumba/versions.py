@@ -0,0 +1,75 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) 2021, Diego Garcia Huerta.
+#
+# Your use of this software as distributed in this GitHub repository, is
+# governed by the MIT License
+#
+# Your use of the Shotgun Pipeline Toolkit is governed by the applicable
+# license agreement between you and Autodesk / Shotgun.
+#
+# Read LICENSE and SHOTGUN_LICENSE for full details about the licenses that
+# pertain to this software.
+# ----------------------------------------------------------------------------
+
+
+"""
+Work file versioning helpers shared by the Rumba publish plugins.
+
+"""
+
+import os
+
+
+__author__ = "Diego Garcia Huerta"
+__contact__ = "https://www.linkedin.com/in/diegogh/"
+
+
+def find_next_free_version(plugin, path, item):
+    """
+    Finds the next version of the given path, and the first version following
+    the path that does not exist on disk yet.
+
+    Each folder the versions are looked up in is listed once per call, rather
+    than checking every version on disk. Nothing is kept between calls, so
+    versions saved by others in the meantime are always seen.
+
+    :param plugin: Publish plugin providing _get_next_version_info
+    :param str path: Path to find the next versions of
+    :param item: Item to process
+
+    :returns: A tuple with the path of the next version, the path of the next
+        free version and its version number. The paths are None if the given
+        path is not versioned.
+    """
+    folder_contents = {}
+
+    (next_version_path, version) = plugin._get_next_version_info(path, item)
+
+    # just keep asking for the next one until we get one that doesn't exist
+    free_version_path = next_version_path
+    while free_version_path and _path_exists(free_version_path, folder_contents):
+        (free_version_path, version) = plugin._get_next_version_info(
+            free_version_path, item
+        )
+
+    return next_version_path, free_version_path, version
+
+
+def _path_exists(path, folder_contents):
+    """
+    Return True if the given path exists, listing its folder only the first
+    time, into the given dictionary of folder contents.
+    """
+    folder, name = os.path.split(path)
+    contents = folder_contents.get(folder)
+    if contents is None:
+        try:
+            # names are compared as the file system would, ie. on windows
+            contents = frozenset(
+                os.path.normcase(entry) for entry in os.listdir(folder)
+            )
+        except OSError:
+            contents = frozenset()
+        folder_contents[folder] = contents
+
+    return os.path.normcase(name) in contents
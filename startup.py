@@ -14,7 +14,7 @@
 
 import os
 import sys
-import cgitb
+import functools
 
 
 import sgtk
@@ -31,8 +31,32 @@ APPLICATION_NAME = "Rumba"
 
 logger = sgtk.LogManager.get_logger(__name__)
 
-# Let's enable cool and detailed tracebacks
-cgitb.enable(format="text")
+# Let's enable cool and detailed tracebacks, only on request as cgitb pulls
+# in a good chunk of the standard library when imported
+if os.environ.get("TK_RUMBA_DEBUG_TB"):
+    import cgitb
+
+    cgitb.enable(format="text")
+
+# key into the executable templates for the platform we are running on, it
+# does not change for the life of the process
+if sgtk.util.is_macos():
+    PLATFORM_KEY = "darwin"
+elif sgtk.util.is_windows():
+    PLATFORM_KEY = "win32"
+elif sgtk.util.is_linux():
+    PLATFORM_KEY = "linux"
+else:
+    PLATFORM_KEY = None
+
+# characters that make an executable template a pattern to glob and match,
+# either glob wildcards or the start of a named {component} placeholder
+GLOB_CHARACTERS = "*?[{"
+
+# software versions found by previous scans, keyed by everything the scan
+# depends on, as the installed executables do not change while the launcher
+# is running
+_SCANNED_SOFTWARE = {}
 
 
 class RumbaLauncher(SoftwareLauncher):
@@ -80,11 +104,14 @@ class RumbaLauncher(SoftwareLauncher):
 
         # Run the engine's init.py file when the application starts up
         resources_plugins_path = os.path.join(self.disk_location, "startup")
-        required_env["RUMBA_USER_PLUGINS"] = (
-            os.environ.get("RUMBA_USER_PLUGINS", "")
-            + os.pathsep
-            + resources_plugins_path
-        )
+        user_plugins = [
+            path
+            for path in os.environ.get("RUMBA_USER_PLUGINS", "").split(os.pathsep)
+            if path
+        ]
+        if resources_plugins_path not in user_plugins:
+            user_plugins.append(resources_plugins_path)
+        required_env["RUMBA_USER_PLUGINS"] = os.pathsep.join(user_plugins)
 
         # Prepare the launch environment with variables required by the
         # classic bootstrap approach.
@@ -93,7 +120,7 @@ class RumbaLauncher(SoftwareLauncher):
         )
 
         required_env["SGTK_ENGINE"] = ENGINE_NAME
-        required_env["SGTK_CONTEXT"] = sgtk.context.serialize(self.context)
+        required_env["SGTK_CONTEXT"] = self._serialized_context
         required_env["SGTK_MODULE_PATH"] = get_sgtk_module_path()
 
         if file_to_open:
@@ -102,16 +129,37 @@ class RumbaLauncher(SoftwareLauncher):
 
         return LaunchInformation(path=exec_path, args=args, environ=required_env)
 
-    def _icon_from_engine(self):
+    @property
+    def _serialized_context(self):
+        """
+        The launcher context serialized to be passed to the application.
+
+        The serialized string is reused for as long as the launcher context
+        is the same object, so successive launches do not serialize it again.
+
+        :returns: Serialized context as a string.
+        """
+        context = self.context
+        if getattr(self, "_serialized_context_source", None) is not context:
+            self._serialized_context_value = sgtk.context.serialize(context)
+            self._serialized_context_source = context
+        return self._serialized_context_value
+
+    @property
+    def _icon(self):
         """
         Use the default engine icon as the application does not supply
         an icon in their software directory structure.
 
+        The path is only built the first time it is requested.
+
         :returns: Full path to application icon as a string or None.
         """
-
-        # the engine icon
-        engine_icon = os.path.join(self.disk_location, "icon_256.png")
+        engine_icon = getattr(self, "_engine_icon", None)
+        if engine_icon is None:
+            # the engine icon
+            engine_icon = os.path.join(self.disk_location, "icon_256.png")
+            self._engine_icon = engine_icon
         return engine_icon
 
     def scan_software(self):
@@ -120,12 +168,24 @@ class RumbaLauncher(SoftwareLauncher):
 
         :return: A list of :class:`SoftwareVersion` objects.
         """
+        scan_key = (
+            sys.platform,
+            self.disk_location,
+            os.environ.get("RUMBA_BIN", ""),
+            os.environ.get("SGTK_RUMBA_CMD_EXTRA_ARGS", ""),
+        )
+        if scan_key in _SCANNED_SOFTWARE:
+            self.logger.debug("Using cached %s executables." % APPLICATION_NAME)
+            return list(_SCANNED_SOFTWARE[scan_key])
+
         self.logger.debug("Scanning for %s executables..." % APPLICATION_NAME)
 
         supported_sw_versions = []
         for sw_version in self._find_software():
             supported_sw_versions.append(sw_version)
 
+        _SCANNED_SOFTWARE[scan_key] = tuple(supported_sw_versions)
+
         return supported_sw_versions
 
     def _find_software(self):
@@ -134,15 +194,7 @@ class RumbaLauncher(SoftwareLauncher):
         """
 
         # all the executable templates for the current OS
-        executable_templates = self.EXECUTABLE_TEMPLATES.get(
-            "darwin"
-            if sgtk.util.is_macos()
-            else "win32"
-            if sgtk.util.is_windows()
-            else "linux"
-            if sgtk.util.is_linux()
-            else []
-        )
+        executable_templates = self.EXECUTABLE_TEMPLATES.get(PLATFORM_KEY, [])
 
         # all the discovered executables
         sw_versions = []
@@ -154,34 +206,59 @@ class RumbaLauncher(SoftwareLauncher):
         # to because the engine class has not even been instantiated yet.
         extra_args = os.environ.get("SGTK_RUMBA_CMD_EXTRA_ARGS")
 
+        # the same arguments are passed to every executable found
+        args = [extra_args] if extra_args else []
+
+        # no way to extract the version from this application, so no
+        # version is available to display, only the executable path differs
+        # between the software versions found
+        make_sw_version = functools.partial(
+            SoftwareVersion, " ", APPLICATION_NAME, icon=self._icon, args=args
+        )
+
+        # an explicitly configured executable is the one to use, there is no
+        # need to look for the default install locations
+        rumba_bin = os.path.expandvars(
+            os.path.expanduser(os.environ.get("RUMBA_BIN", ""))
+        )
+        if rumba_bin and os.path.exists(rumba_bin):
+            self.logger.debug("Using RUMBA_BIN executable %s.", rumba_bin)
+            return [make_sw_version(rumba_bin)]
+
+        # templates and executables already processed, different templates
+        # can expand to, or match, the same path
+        seen_templates = set()
+        seen_executables = set()
+
         for executable_template in executable_templates:
             executable_template = os.path.expanduser(executable_template)
             executable_template = os.path.expandvars(executable_template)
 
+            template_key = os.path.normcase(os.path.normpath(executable_template))
+            if template_key in seen_templates:
+                continue
+            seen_templates.add(template_key)
+
             self.logger.debug("Processing template %s.", executable_template)
 
-            executable_matches = self._glob_and_match(
-                executable_template, self.COMPONENT_REGEX_LOOKUP
-            )
+            if not any(c in executable_template for c in GLOB_CHARACTERS):
+                # a plain path either exists or not, no need to glob for it
+                if os.path.exists(executable_template):
+                    executable_matches = [(executable_template, {})]
+                else:
+                    executable_matches = []
+            else:
+                executable_matches = self._glob_and_match(
+                    executable_template, self.COMPONENT_REGEX_LOOKUP
+                )
 
             # Extract all products from that executable.
             for (executable_path, key_dict) in executable_matches:
-                # no way to extract the version from this application, so no
-                # version is available to display
-                executable_version = " "
-
-                args = []
-                if extra_args:
-                    args.append(extra_args)
-
-                sw_versions.append(
-                    SoftwareVersion(
-                        executable_version,
-                        APPLICATION_NAME,
-                        executable_path,
-                        icon=self._icon_from_engine(),
-                        args=args,
-                    )
-                )
+                executable_key = os.path.normcase(os.path.normpath(executable_path))
+                if executable_key in seen_executables:
+                    continue
+                seen_executables.add(executable_key)
+
+                sw_versions.append(make_sw_version(executable_path))
 
         return sw_versions
@@ -19,12 +19,6 @@ It sets up the Toolkit context and prepares the engine.
 
 import os
 import sys
-import traceback
-
-import logging
-import logging.handlers
-
-import rumba
 
 __author__ = "Diego Garcia Huerta"
 __contact__ = "https://www.linkedin.com/in/diegogh/"
@@ -37,26 +31,22 @@ SGTK_MODULE_PATH = os.environ.get("SGTK_MODULE_PATH")
 if SGTK_MODULE_PATH and SGTK_MODULE_PATH not in sys.path:
     sys.path.insert(0, SGTK_MODULE_PATH)
 
-try:
-    import sgtk
-except ImportError as e:
-    msg = "Shotgun: Could not import sgtk!: %s" % e
-    raise ImportError(msg)
-
 
-logger = sgtk.LogManager.get_logger(__name__)
+ERROR_PREFIX = "Shotgun Error | %s | " % ENGINE_NAME
+WARNING_PREFIX = "Shotgun Warning | %s | " % ENGINE_NAME
+INFO_PREFIX = "Shotgun Info | %s | " % ENGINE_NAME
 
 
 def display_error(msg):
-    print(("Shotgun Error | %s | %s " % (ENGINE_NAME, msg)))
+    sys.stdout.write(ERROR_PREFIX + msg + "\n")
 
 
 def display_warning(msg):
-    print(("Shotgun Warning | %s | %s " % (ENGINE_NAME, msg)))
+    sys.stdout.write(WARNING_PREFIX + msg + "\n")
 
 
 def display_info(msg):
-    print(("Shotgun Info | %s | %s " % (ENGINE_NAME, msg)))
+    sys.stdout.write(INFO_PREFIX + msg + "\n")
 
 
 def start_toolkit_classic(logger):
@@ -66,6 +56,8 @@ def start_toolkit_classic(logger):
     the engine and environment.
     """
 
+    import sgtk
+
     logger.debug("Launching toolkit in classic mode.")
 
     # Get the name of the engine to start from the environement
@@ -89,8 +81,9 @@ def start_toolkit_classic(logger):
             "Shotgun: Could not create context! Shotgun Pipeline Toolkit"
             " will be disabled. Details: %s" % e
         )
-        etype, value, tb = sys.exc_info()
-        msg += "".join(traceback.format_exception(etype, value, tb))
+        import traceback
+
+        msg += traceback.format_exc()
         display_error(msg)
         return
 
@@ -102,8 +95,9 @@ def start_toolkit_classic(logger):
         sgtk.platform.start_engine(env_engine, context.sgtk, context)
     except Exception as e:
         msg = "Shotgun: Could not start engine. Details: %s" % e
-        etype, value, tb = sys.exc_info()
-        msg += "".join(traceback.format_exception(etype, value, tb))
+        import traceback
+
+        msg += traceback.format_exc()
         display_error(msg)
         return
 
@@ -114,6 +108,12 @@ def start_toolkit():
     environment variables.
     """
 
+    # Rumba was not launched by Toolkit, there is no engine to start, so do
+    # not bother importing sgtk or setting up its logging. A Toolkit launch
+    # missing anything else is reported by start_toolkit_classic.
+    if not os.environ.get("SGTK_ENGINE"):
+        return
+
     # Verify sgtk can be loaded.
     try:
         import sgtk
@@ -135,13 +135,14 @@ def start_toolkit():
     if file_to_open:
         msg = "Shotgun: Opening '%s'..." % file_to_open
         display_info(msg)
+
+        import rumba
+
         rumba.load_document(file_to_open)
 
     # Clean up temp env variables.
-    del_vars = ["SGTK_ENGINE", "SGTK_CONTEXT", "SGTK_FILE_TO_OPEN"]
-    for var in del_vars:
-        if var in os.environ:
-            del os.environ[var]
+    for var in ("SGTK_ENGINE", "SGTK_CONTEXT", "SGTK_FILE_TO_OPEN"):
+        os.environ.pop(var, None)
 
 
 start_toolkit()